@@ -0,0 +1,118 @@
+"""Initial schema, including the composite lookup indexes
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "clients",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("phone", sa.String(length=50), nullable=True),
+        sa.Column("settings", postgresql.JSONB(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("email"),
+    )
+    op.create_index("ix_clients_id", "clients", ["id"])
+
+    op.create_table(
+        "campaigns",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("client_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("message_templates", postgresql.JSONB(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["client_id"], ["clients.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_campaigns_id", "campaigns", ["id"])
+
+    op.create_table(
+        "leads",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("campaign_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("phone", sa.String(length=50), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=True),
+        sa.Column("lead_data", postgresql.JSONB(), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=True),
+        sa.Column("lead_score", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["campaign_id"], ["campaigns.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_leads_id", "leads", ["id"])
+    op.create_index(
+        "ix_leads_campaign_status",
+        "leads",
+        ["campaign_id", "status"],
+        postgresql_include=["lead_score", "name"],
+    )
+
+    op.create_table(
+        "conversations",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("lead_id", sa.Integer(), nullable=False),
+        sa.Column("message_id", sa.String(length=255), nullable=True),
+        sa.Column("direction", sa.String(length=20), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("metadata", postgresql.JSONB(), nullable=True),
+        sa.Column("sent_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["lead_id"], ["leads.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("message_id"),
+    )
+    op.create_index("ix_conversations_id", "conversations", ["id"])
+    op.create_index("ix_conversations_lead_sent_at", "conversations", ["lead_id", "sent_at"])
+
+    op.create_table(
+        "analytics",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("campaign_id", sa.Integer(), nullable=False),
+        sa.Column("lead_id", sa.Integer(), nullable=False),
+        sa.Column("event_type", sa.String(length=100), nullable=False),
+        sa.Column("event_data", postgresql.JSONB(), nullable=True),
+        sa.Column("event_time", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["campaign_id"], ["campaigns.id"]),
+        sa.ForeignKeyConstraint(["lead_id"], ["leads.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_analytics_id", "analytics", ["id"])
+    op.create_index("ix_analytics_campaign_event", "analytics", ["campaign_id", "event_type", "event_time"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_analytics_campaign_event", table_name="analytics")
+    op.drop_index("ix_analytics_id", table_name="analytics")
+    op.drop_table("analytics")
+    op.drop_index("ix_conversations_lead_sent_at", table_name="conversations")
+    op.drop_index("ix_conversations_id", table_name="conversations")
+    op.drop_table("conversations")
+    op.drop_index("ix_leads_campaign_status", table_name="leads")
+    op.drop_index("ix_leads_id", table_name="leads")
+    op.drop_table("leads")
+    op.drop_index("ix_campaigns_id", table_name="campaigns")
+    op.drop_table("campaigns")
+    op.drop_index("ix_clients_id", table_name="clients")
+    op.drop_table("clients")
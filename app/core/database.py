@@ -1,19 +1,63 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, DateTime, JSON, ForeignKey
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, sessionmaker, relationship
 from sqlalchemy.sql import func
+from asyncio import current_task
 from datetime import datetime
-from typing import Optional
-import json
+from typing import AsyncIterator, Optional
+import orjson
 
 from app.core.config import settings
 
+def _json_serializer(value) -> str:
+    """Serialize JSONB values with orjson (drivers expect str, not bytes)"""
+    # Non-str keys are stringified, as the stdlib json serializer did
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
 # Create database engine
-engine = create_engine(settings.DATABASE_URL)
+# values_plus_batch batches INSERTs into multi-row VALUES pages and runs
+# executemany UPDATE/DELETE through psycopg2's execute_batch.
+engine = create_engine(
+    settings.DATABASE_URL,
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_use_lifo=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for the request path, so queries in async FastAPI handlers
+# cooperate with the event loop instead of occupying the threadpool.
+# The sync engine above is kept for DDL and background jobs.
+# asyncpg prepares every statement; a larger per-connection cache keeps
+# the parsed/planned statements around instead of re-preparing them.
+async_engine = create_async_engine(
+    settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1),
+    connect_args={"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE},
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_use_lifo=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+# One session per asyncio task (i.e. per request), shared by nested
+# dependencies and services instead of opening a new one each time
+ScopedSession = async_scoped_session(AsyncSessionLocal, scopefunc=current_task)
+
 # Create base class for models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    pass
 
 class Client(Base):
     """Client/Company model"""
@@ -23,15 +67,12 @@ class Client(Base):
     name = Column(String(255), nullable=False)
     email = Column(String(255), unique=True, nullable=False)
     phone = Column(String(50))
-    settings = Column(JSON, default={})
+    settings = Column(JSONB, default=dict)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
     campaigns = relationship("Campaign", back_populates="client")
-    
-    def __repr__(self):
-        return f"<Client(id={self.id}, name='{self.name}')>"
 
 class Campaign(Base):
     """Campaign model"""
@@ -41,7 +82,7 @@ class Campaign(Base):
     client_id = Column(Integer, ForeignKey("clients.id"), nullable=False)
     name = Column(String(255), nullable=False)
     description = Column(Text)
-    message_templates = Column(JSON, default={})
+    message_templates = Column(JSONB, default=dict)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -49,20 +90,26 @@ class Campaign(Base):
     # Relationships
     client = relationship("Client", back_populates="campaigns")
     leads = relationship("Lead", back_populates="campaign")
-    
-    def __repr__(self):
-        return f"<Campaign(id={self.id}, name='{self.name}', client_id={self.client_id})>"
 
 class Lead(Base):
     """Lead model"""
     __tablename__ = "leads"
+    __table_args__ = (
+        # Covers campaign lead lists filtered by status (index-only scans)
+        Index(
+            "ix_leads_campaign_status",
+            "campaign_id",
+            "status",
+            postgresql_include=["lead_score", "name"],
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=False)
     name = Column(String(255), nullable=False)
     phone = Column(String(50), nullable=False)
     email = Column(String(255))
-    lead_data = Column(JSON, default={})  # Original form data
+    lead_data = Column(JSONB, default=dict)  # Original form data
     status = Column(String(50), default="new")  # new, contacted, responded, converted, lost
     lead_score = Column(Integer, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -72,50 +119,48 @@ class Lead(Base):
     campaign = relationship("Campaign", back_populates="leads")
     conversations = relationship("Conversation", back_populates="lead")
     analytics = relationship("Analytics", back_populates="lead")
-    
-    def __repr__(self):
-        return f"<Lead(id={self.id}, name='{self.name}', phone='{self.phone}')>"
 
 class Conversation(Base):
     """Conversation model"""
     __tablename__ = "conversations"
+    __table_args__ = (
+        Index("ix_conversations_lead_sent_at", "lead_id", "sent_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     lead_id = Column(Integer, ForeignKey("leads.id"), nullable=False)
     message_id = Column(String(255), unique=True)  # Twilio message ID
     direction = Column(String(20), nullable=False)  # inbound, outbound
     content = Column(Text, nullable=False)
-    metadata = Column(JSON, default={})  # Additional message data
+    # "metadata" is reserved on declarative classes; the column keeps its name
+    message_metadata = Column("metadata", JSONB, default=dict)  # Additional message data
     sent_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     lead = relationship("Lead", back_populates="conversations")
-    
-    def __repr__(self):
-        return f"<Conversation(id={self.id}, direction='{self.direction}', lead_id={self.lead_id})>"
 
 class Analytics(Base):
     """Analytics model"""
     __tablename__ = "analytics"
+    __table_args__ = (
+        Index("ix_analytics_campaign_event", "campaign_id", "event_type", "event_time"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=False)
     lead_id = Column(Integer, ForeignKey("leads.id"), nullable=False)
     event_type = Column(String(100), nullable=False)  # message_sent, message_received, conversion, etc.
-    event_data = Column(JSON, default={})
+    event_data = Column(JSONB, default=dict)
     event_time = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     lead = relationship("Lead", back_populates="analytics")
-    
-    def __repr__(self):
-        return f"<Analytics(id={self.id}, event_type='{self.event_type}', lead_id={self.lead_id})>"
 
 # Database dependency
-def get_db():
+async def get_db() -> AsyncIterator[AsyncSession]:
     """Database session dependency"""
-    db = SessionLocal()
+    db = ScopedSession()
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        await ScopedSession.remove() 
\ No newline at end of file
@@ -1,40 +1,115 @@
 import structlog
+import orjson
+import atexit
+import io
 import logging
+import queue
 import sys
-from typing import Any, Dict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+_log_queue: "queue.Queue[Any]" = queue.Queue(-1)
+_listener: Optional[QueueListener] = None
+
+class _QueueWriter:
+    """File-like sink that hands rendered structlog lines to the log queue"""
+
+    def write(self, data: bytes) -> None:
+        _log_queue.put_nowait(data)
+
+    def flush(self) -> None:
+        pass
+
+class _TextStreamWriter:
+    """Bytes adapter for a text-only stdout replacement (e.g. StringIO)"""
+
+    def __init__(self, stream: Any):
+        self._stream = stream
+
+    def write(self, data: bytes) -> None:
+        self._stream.write(data.decode("utf-8"))
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+def _open_stdout() -> Any:
+    """Binary stdout writer: buffered on the raw fd when stdout has one"""
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        # Captured or embedded stdout without a file descriptor
+        # (io.UnsupportedOperation is an OSError/ValueError subclass)
+        buffer = getattr(sys.stdout, "buffer", None)
+        return buffer if buffer is not None else _TextStreamWriter(sys.stdout)
+    return io.BufferedWriter(io.FileIO(fd, "wb", closefd=False), buffer_size=8192)
+
+class _StdoutListener(QueueListener):
+    """Drains the log queue on a background thread into a buffered stdout"""
+
+    def __init__(self, log_queue: "queue.Queue[Any]"):
+        super().__init__(log_queue)
+        self._stream = _open_stdout()
+
+    def handle(self, record: Any) -> None:
+        # structlog lines arrive pre-rendered (newline included); stdlib
+        # records were already formatted by QueueHandler.prepare()
+        if isinstance(record, bytes):
+            self._stream.write(record)
+        else:
+            self._stream.write(record.getMessage().encode("utf-8") + b"\n")
+
+        # Batch writes while the queue is busy, flush as soon as it drains
+        if self.queue.empty():
+            self._stream.flush()
+
+    def stop(self) -> None:
+        super().stop()
+        self._stream.flush()
 
 def setup_logging():
     """Setup structured logging for the application"""
-    
+    global _listener
+
+    log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
+
     # Configure structlog
+    # orjson renders straight to bytes, so events are written to the binary
+    # stdout buffer without a str -> UTF-8 round-trip. The filtering bound
+    # logger turns calls below log_level into no-ops before any processor
+    # runs; format_exc_info only does work when exc_info is attached.
     structlog.configure(
         processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
         ],
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=structlog.BytesLoggerFactory(file=_QueueWriter()),
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         cache_logger_on_first_use=True,
     )
-    
+
     # Configure standard library logging
+    # Handlers only enqueue; the stdout write happens on the listener thread
+    # so request handlers never block on I/O.
+    handler = QueueHandler(_log_queue)
+    handler.setFormatter(logging.Formatter("%(message)s"))
     logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=logging.INFO,
+        handlers=[handler],
+        level=log_level,
     )
-    
+
+    if _listener is None:
+        _listener = _StdoutListener(_log_queue)
+        _listener.start()
+        atexit.register(_listener.stop)
+
     # Set log levels for external libraries
     logging.getLogger("uvicorn").setLevel(logging.INFO)
     logging.getLogger("fastapi").setLevel(logging.INFO)
     logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
     logging.getLogger("openai").setLevel(logging.WARNING)
-    logging.getLogger("twilio").setLevel(logging.WARNING) 
\ No newline at end of file
+    logging.getLogger("twilio").setLevel(logging.WARNING)
\ No newline at end of file
@@ -1,5 +1,7 @@
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer
 from contextlib import asynccontextmanager
 import structlog
@@ -23,9 +25,11 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting AI Sales Agent application")
     
-    # Create database tables
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables created")
+    # Create database tables in development only; elsewhere the schema is
+    # managed by Alembic (docker-entrypoint.sh runs `alembic upgrade head`)
+    if settings.DEBUG:
+        Base.metadata.create_all(bind=engine)
+        logger.info("Database tables created")
     
     yield
     
@@ -39,6 +43,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -51,6 +56,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (list endpoints); small payloads are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
 
@@ -76,10 +84,15 @@ async def health_check():
     }
 
 if __name__ == "__main__":
+    import os
     import uvicorn
     uvicorn.run(
         "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
+        host=settings.HOST,
+        port=settings.PORT,
+        loop="uvloop",
+        http="httptools",
+        # reload only supports a single worker process
+        workers=1 if settings.DEBUG else (os.cpu_count() or 1),
+        reload=settings.DEBUG
     ) 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
 
@@ -7,7 +7,7 @@ class CampaignBase(BaseModel):
     name: str
     description: Optional[str] = None
     client_id: int
-    message_templates: Optional[Dict[str, Any]] = {}
+    message_templates: Optional[Dict[str, Any]] = Field(default_factory=dict)
     is_active: bool = True
 
 class CampaignCreate(CampaignBase):
@@ -27,8 +27,7 @@ class CampaignResponse(CampaignBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class CampaignList(BaseModel):
     """Schema for campaign list response"""
@@ -39,5 +38,4 @@ class CampaignList(BaseModel):
     is_active: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True) 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
 
@@ -7,7 +7,7 @@ class ClientBase(BaseModel):
     name: str
     email: EmailStr
     phone: Optional[str] = None
-    settings: Optional[Dict[str, Any]] = {}
+    settings: Optional[Dict[str, Any]] = Field(default_factory=dict)
 
 class ClientCreate(ClientBase):
     """Schema for creating a new client"""
@@ -26,8 +26,7 @@ class ClientResponse(ClientBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ClientList(BaseModel):
     """Schema for client list response"""
@@ -37,5 +36,4 @@ class ClientList(BaseModel):
     phone: Optional[str] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True) 
\ No newline at end of file
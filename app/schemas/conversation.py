@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
 
@@ -6,7 +6,11 @@ class ConversationBase(BaseModel):
     """Base conversation schema"""
     content: str
     direction: str  # inbound, outbound
-    metadata: Optional[Dict[str, Any]] = {}
+    # ORM rows expose the column as message_metadata
+    metadata: Optional[Dict[str, Any]] = Field(
+        default_factory=dict,
+        validation_alias=AliasChoices("message_metadata", "metadata"),
+    )
 
 class ConversationCreate(ConversationBase):
     """Schema for creating a new conversation"""
@@ -19,8 +23,7 @@ class ConversationResponse(ConversationBase):
     message_id: Optional[str] = None
     sent_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ConversationList(BaseModel):
     """Schema for conversation list response"""
@@ -30,5 +33,4 @@ class ConversationList(BaseModel):
     content: str
     sent_at: datetime
     
-    class Config:
-        from_attributes = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True) 
\ No newline at end of file
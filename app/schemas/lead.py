@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
 
@@ -8,7 +8,7 @@ class LeadBase(BaseModel):
     phone: str
     email: Optional[EmailStr] = None
     campaign_id: int
-    lead_data: Optional[Dict[str, Any]] = {}
+    lead_data: Optional[Dict[str, Any]] = Field(default_factory=dict)
 
 class LeadCreate(LeadBase):
     """Schema for creating a new lead"""
@@ -31,8 +31,7 @@ class LeadResponse(LeadBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class LeadList(BaseModel):
     """Schema for lead list response"""
@@ -45,5 +44,4 @@ class LeadList(BaseModel):
     campaign_id: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True) 
\ No newline at end of file
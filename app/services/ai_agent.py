@@ -1,5 +1,10 @@
+import hashlib
+import httpx
 import openai
-from typing import Dict, List, Optional
+import orjson
+import re
+import redis.asyncio as redis
+from typing import Any, Dict, List, Optional
 import structlog
 from datetime import datetime
 
@@ -7,16 +12,201 @@ from app.core.config import settings
 
 logger = structlog.get_logger()
 
+# Number of most recent messages included in prompts
+HISTORY_WINDOW = 5
+
+# Redis key prefix for cached completions
+COMPLETION_CACHE_PREFIX = "ai:completion:"
+
+# Give up on the cache quickly so an unreachable Redis only adds a short delay
+COMPLETION_CACHE_TIMEOUT_SECONDS = 0.25
+
+_SYSTEM_PROMPT = """
+You are an AI sales agent for a digital marketing agency. Your role is to:
+1. Generate personalized WhatsApp messages for sales leads
+2. Be professional, friendly, and engaging
+3. Focus on the specific service/product the lead showed interest in
+4. Keep messages concise and actionable
+5. Use the client's brand voice and messaging guidelines
+6. Always include a clear next step or call-to-action
+"""
+
+_PROCESSING_SYSTEM_PROMPT = """
+You are an AI sales agent analyzing incoming messages. Your role is to:
+1. Understand the lead's intent and sentiment
+2. Determine the appropriate response action
+3. Generate relevant and helpful responses
+4. Identify conversion opportunities
+5. Handle objections professionally
+6. Escalate to human when necessary
+"""
+
+_INITIAL_PROMPT = """
+Generate a personalized initial WhatsApp message for a sales lead.
+
+Lead Information:
+- Name: {name}
+- Phone: {phone}
+- Email: {email}
+- Additional Data: {lead_data}
+
+Campaign Information:
+- Campaign Name: {campaign_name}
+- Description: {campaign_description}
+- Message Templates: {message_templates}
+
+Client Information:
+- Company Name: {company}
+- Industry: {industry}
+- Services: {services}
+
+Requirements:
+1. Keep the message under 160 characters
+2. Make it personal and engaging
+3. Include a clear call-to-action
+4. Be professional but friendly
+5. Mention the specific service/product they showed interest in
+
+Generate only the message content, no additional formatting.
+"""
+
+_FOLLOW_UP_PROMPT = """
+Generate a follow-up WhatsApp message based on the conversation history.
+
+Lead Information:
+- Name: {name}
+- Current Status: {status}
+
+Conversation History:
+{history}
+
+Campaign Information:
+- Campaign: {campaign_name}
+- Templates: {message_templates}
+
+Client Information:
+- Company: {company}
+
+Requirements:
+1. Keep under 160 characters
+2. Reference previous conversation
+3. Provide value or new information
+4. Include clear next steps
+5. Be persistent but not pushy
+
+Generate only the message content.
+"""
+
+_PROCESSING_PROMPT = """
+Analyze this incoming message and determine the appropriate response.
+
+Incoming Message: "{message}"
+
+Lead Information:
+- Name: {name}
+- Status: {status}
+
+Conversation History:
+{history}
+
+Client Information:
+- Company: {company}
+- Services: {services}
+
+Determine the appropriate action and response:
+1. If they're interested in buying - respond with conversion message
+2. If they have questions - answer professionally
+3. If they want to speak to someone - schedule a call
+4. If they're not interested - politely end conversation
+5. If unclear - ask clarifying questions
+
+Respond in this format:
+ACTION: [action_type]
+MESSAGE: [response_message]
+"""
+
+# Markers in the processing response; MESSAGE may continue over several
+# lines but stops at an ACTION line that follows it
+_ACTION_RE = re.compile(r"^[ \t]*ACTION:[ \t]*(.*)$", re.MULTILINE)
+_MESSAGE_RE = re.compile(
+    r"^[ \t]*MESSAGE:[ \t]*(.*?)(?=^[ \t]*ACTION:|\Z)", re.MULTILINE | re.DOTALL
+)
+
+def _dumps(value: Any) -> str:
+    """Serialize prompt data compactly with orjson"""
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+def _format_history(conversation_history: List[Dict]) -> str:
+    """Render the most recent messages as 'direction: content' lines"""
+    recent = conversation_history[-HISTORY_WINDOW:]
+    return "\n".join([f"{msg['direction']}: {msg['content']}" for msg in recent])
+
 class AIAgent:
     """AI Agent for generating personalized sales messages"""
     
     def __init__(self):
-        openai.api_key = settings.OPENAI_API_KEY
+        # Shared HTTP/2 keep-alive pool so concurrent requests reuse warm
+        # connections to the OpenAI API instead of paying a TLS handshake each
+        self.client = openai.AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=50),
+            ),
+        )
         self.model = settings.OPENAI_MODEL
         self.max_tokens = settings.OPENAI_MAX_TOKENS
         self.temperature = settings.OPENAI_TEMPERATURE
+        
+        # System messages never change, so build them once and reuse
+        self._sys_msg = {"role": "system", "content": self._get_system_prompt()}
+        self._proc_sys_msg = {"role": "system", "content": self._get_processing_system_prompt()}
+        self.cache = redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=COMPLETION_CACHE_TIMEOUT_SECONDS,
+            socket_timeout=COMPLETION_CACHE_TIMEOUT_SECONDS,
+        ) if settings.AI_COMPLETION_CACHE_TTL_SECONDS else None
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP and Redis connections"""
+        await self.client.close()
+        if self.cache is not None:
+            await self.cache.aclose()
     
-    def generate_initial_message(
+    async def _complete(self, system_message: Dict, prompt: str) -> str:
+        """Run a chat completion, reusing a cached answer for an identical prompt"""
+        
+        cache_key = None
+        if self.cache is not None:
+            digest = hashlib.blake2b(
+                f"{self.model}|{self.temperature}|{self.max_tokens}|{system_message['content']}|{prompt}".encode(),
+                digest_size=16,
+            ).hexdigest()
+            cache_key = COMPLETION_CACHE_PREFIX + digest
+            try:
+                cached = await self.cache.get(cache_key)
+                if cached is not None:
+                    return cached.decode()
+            except redis.RedisError as e:
+                logger.warning("Completion cache lookup failed", error=str(e))
+        
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[system_message, {"role": "user", "content": prompt}],
+            max_tokens=self.max_tokens,
+            temperature=self.temperature
+        )
+        content = response.choices[0].message.content.strip()
+        
+        if cache_key is not None:
+            try:
+                await self.cache.set(cache_key, content, ex=settings.AI_COMPLETION_CACHE_TTL_SECONDS)
+            except redis.RedisError as e:
+                logger.warning("Completion cache store failed", error=str(e))
+        
+        return content
+    
+    async def generate_initial_message(
         self, 
         lead_data: Dict, 
         campaign_data: Dict,
@@ -27,17 +217,7 @@ class AIAgent:
         prompt = self._build_initial_prompt(lead_data, campaign_data, client_data)
         
         try:
-            response = openai.ChatCompletion.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self._get_system_prompt()},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
-            )
-            
-            message = response.choices[0].message.content.strip()
+            message = await self._complete(self._sys_msg, prompt)
             logger.info("Generated initial message", lead_id=lead_data.get("id"), message_length=len(message))
             
             return message
@@ -46,7 +226,7 @@ class AIAgent:
             logger.error("Failed to generate initial message", error=str(e))
             return self._get_fallback_message(lead_data, client_data)
     
-    def generate_follow_up_message(
+    async def generate_follow_up_message(
         self, 
         lead_data: Dict,
         campaign_data: Dict,
@@ -60,17 +240,7 @@ class AIAgent:
         )
         
         try:
-            response = openai.ChatCompletion.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self._get_system_prompt()},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
-            )
-            
-            message = response.choices[0].message.content.strip()
+            message = await self._complete(self._sys_msg, prompt)
             logger.info("Generated follow-up message", lead_id=lead_data.get("id"))
             
             return message
@@ -79,7 +249,7 @@ class AIAgent:
             logger.error("Failed to generate follow-up message", error=str(e))
             return self._get_fallback_follow_up(lead_data, client_data)
     
-    def process_incoming_message(
+    async def process_incoming_message(
         self, 
         message: str, 
         lead_data: Dict,
@@ -94,17 +264,7 @@ class AIAgent:
         )
         
         try:
-            response = openai.ChatCompletion.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self._get_processing_system_prompt()},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
-            )
-            
-            result = response.choices[0].message.content.strip()
+            result = await self._complete(self._proc_sys_msg, prompt)
             
             # Parse the response to extract action and message
             action, response_message = self._parse_processing_response(result)
@@ -130,34 +290,19 @@ class AIAgent:
     def _build_initial_prompt(self, lead_data: Dict, campaign_data: Dict, client_data: Dict) -> str:
         """Build prompt for initial message generation"""
         
-        return f"""
-        Generate a personalized initial WhatsApp message for a sales lead.
-        
-        Lead Information:
-        - Name: {lead_data.get('name', 'Unknown')}
-        - Phone: {lead_data.get('phone', 'Unknown')}
-        - Email: {lead_data.get('email', 'Unknown')}
-        - Additional Data: {lead_data.get('lead_data', {})}
-        
-        Campaign Information:
-        - Campaign Name: {campaign_data.get('name', 'Unknown')}
-        - Description: {campaign_data.get('description', 'Unknown')}
-        - Message Templates: {campaign_data.get('message_templates', {})}
-        
-        Client Information:
-        - Company Name: {client_data.get('name', 'Unknown')}
-        - Industry: {client_data.get('settings', {}).get('industry', 'Unknown')}
-        - Services: {client_data.get('settings', {}).get('services', [])}
-        
-        Requirements:
-        1. Keep the message under 160 characters
-        2. Make it personal and engaging
-        3. Include a clear call-to-action
-        4. Be professional but friendly
-        5. Mention the specific service/product they showed interest in
-        
-        Generate only the message content, no additional formatting.
-        """
+        client_settings = client_data.get('settings') or {}
+        return _INITIAL_PROMPT.format(
+            name=lead_data.get('name', 'Unknown'),
+            phone=lead_data.get('phone', 'Unknown'),
+            email=lead_data.get('email', 'Unknown'),
+            lead_data=_dumps(lead_data.get('lead_data', {})),
+            campaign_name=campaign_data.get('name', 'Unknown'),
+            campaign_description=campaign_data.get('description', 'Unknown'),
+            message_templates=_dumps(campaign_data.get('message_templates', {})),
+            company=client_data.get('name', 'Unknown'),
+            industry=client_settings.get('industry', 'Unknown'),
+            services=_dumps(client_settings.get('services', [])),
+        )
     
     def _build_follow_up_prompt(
         self, 
@@ -168,37 +313,14 @@ class AIAgent:
     ) -> str:
         """Build prompt for follow-up message generation"""
         
-        history_text = "\n".join([
-            f"{msg['direction']}: {msg['content']}" 
-            for msg in conversation_history[-5:]  # Last 5 messages
-        ])
-        
-        return f"""
-        Generate a follow-up WhatsApp message based on the conversation history.
-        
-        Lead Information:
-        - Name: {lead_data.get('name', 'Unknown')}
-        - Current Status: {lead_data.get('status', 'Unknown')}
-        
-        Conversation History:
-        {history_text}
-        
-        Campaign Information:
-        - Campaign: {campaign_data.get('name', 'Unknown')}
-        - Templates: {campaign_data.get('message_templates', {})}
-        
-        Client Information:
-        - Company: {client_data.get('name', 'Unknown')}
-        
-        Requirements:
-        1. Keep under 160 characters
-        2. Reference previous conversation
-        3. Provide value or new information
-        4. Include clear next steps
-        5. Be persistent but not pushy
-        
-        Generate only the message content.
-        """
+        return _FOLLOW_UP_PROMPT.format(
+            name=lead_data.get('name', 'Unknown'),
+            status=lead_data.get('status', 'Unknown'),
+            history=_format_history(conversation_history),
+            campaign_name=campaign_data.get('name', 'Unknown'),
+            message_templates=_dumps(campaign_data.get('message_templates', {})),
+            company=client_data.get('name', 'Unknown'),
+        )
     
     def _build_processing_prompt(
         self, 
@@ -210,74 +332,36 @@ class AIAgent:
     ) -> str:
         """Build prompt for processing incoming messages"""
         
-        history_text = "\n".join([
-            f"{msg['direction']}: {msg['content']}" 
-            for msg in conversation_history[-5:]
-        ])
-        
-        return f"""
-        Analyze this incoming message and determine the appropriate response.
-        
-        Incoming Message: "{message}"
-        
-        Lead Information:
-        - Name: {lead_data.get('name', 'Unknown')}
-        - Status: {lead_data.get('status', 'Unknown')}
-        
-        Conversation History:
-        {history_text}
-        
-        Client Information:
-        - Company: {client_data.get('name', 'Unknown')}
-        - Services: {client_data.get('settings', {}).get('services', [])}
-        
-        Determine the appropriate action and response:
-        1. If they're interested in buying - respond with conversion message
-        2. If they have questions - answer professionally
-        3. If they want to speak to someone - schedule a call
-        4. If they're not interested - politely end conversation
-        5. If unclear - ask clarifying questions
-        
-        Respond in this format:
-        ACTION: [action_type]
-        MESSAGE: [response_message]
-        """
+        client_settings = client_data.get('settings') or {}
+        return _PROCESSING_PROMPT.format(
+            message=message,
+            name=lead_data.get('name', 'Unknown'),
+            status=lead_data.get('status', 'Unknown'),
+            history=_format_history(conversation_history),
+            company=client_data.get('name', 'Unknown'),
+            services=_dumps(client_settings.get('services', [])),
+        )
     
     def _get_system_prompt(self) -> str:
         """Get system prompt for message generation"""
-        return """
-        You are an AI sales agent for a digital marketing agency. Your role is to:
-        1. Generate personalized WhatsApp messages for sales leads
-        2. Be professional, friendly, and engaging
-        3. Focus on the specific service/product the lead showed interest in
-        4. Keep messages concise and actionable
-        5. Use the client's brand voice and messaging guidelines
-        6. Always include a clear next step or call-to-action
-        """
+        return _SYSTEM_PROMPT
     
     def _get_processing_system_prompt(self) -> str:
         """Get system prompt for message processing"""
-        return """
-        You are an AI sales agent analyzing incoming messages. Your role is to:
-        1. Understand the lead's intent and sentiment
-        2. Determine the appropriate response action
-        3. Generate relevant and helpful responses
-        4. Identify conversion opportunities
-        5. Handle objections professionally
-        6. Escalate to human when necessary
-        """
+        return _PROCESSING_SYSTEM_PROMPT
     
     def _parse_processing_response(self, response: str) -> tuple:
         """Parse the processing response to extract action and message"""
-        lines = response.strip().split('\n')
         action = "respond"
         message = "Thank you for your message. I'll be happy to help you."
         
-        for line in lines:
-            if line.startswith("ACTION:"):
-                action = line.replace("ACTION:", "").strip()
-            elif line.startswith("MESSAGE:"):
-                message = line.replace("MESSAGE:", "").strip()
+        action_match = _ACTION_RE.search(response)
+        if action_match:
+            action = action_match.group(1).strip()
+        
+        message_match = _MESSAGE_RE.search(response)
+        if message_match:
+            message = message_match.group(1).strip()
         
         return action, message
     
@@ -1,27 +1,387 @@
 from twilio.rest import Client
-from twilio.base.exceptions import TwilioException
-from typing import Dict, Optional, List
+from twilio.base.exceptions import TwilioException, TwilioRestException
+from twilio.http.http_client import TwilioHttpClient
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, List, Sequence, Set, Tuple, Union
+import asyncio
+import base64
+import hashlib
+import hmac
+import httpx
+import orjson
+import string
 import structlog
+import threading
+import time
+import weakref
+from cachetools import TTLCache
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-import json
+from urllib.parse import urlsplit
 
 from app.core.config import settings
 
 logger = structlog.get_logger()
 
+TWILIO_API_BASE_URL = "https://api.twilio.com/2010-04-01"
+
+# Bulk send pipeline: concurrent senders and prepared-message backlog
+BULK_SEND_WORKERS = 32
+BULK_QUEUE_SIZE = 1024
+
+# Message POSTs are retried only on statuses where Twilio did not accept the
+# message (rate limited / unavailable); other 5xx may already have been sent
+RETRYABLE_POST_STATUSES = frozenset({429, 503})
+
+# Usage records fetched per Twilio API page
+USAGE_PAGE_SIZE = 1000
+
+# Account details rarely change; refetch from Twilio at most this often
+ACCOUNT_INFO_TTL_SECONDS = 3600
+
+# Simple template system - in production, you'd use Twilio's template system
+MESSAGE_TEMPLATES = {
+    "welcome": "Hi {name}! Welcome to {company}. Thanks for your interest in {service}.",
+    "follow_up": "Hi {name}! Just following up on our conversation about {service}. Are you still interested?",
+    "appointment": "Hi {name}! Your appointment with {company} is confirmed for {date} at {time}.",
+    "reminder": "Hi {name}! Don't forget about your upcoming {service} consultation.",
+    "thank_you": "Hi {name}! Thank you for choosing {company}. We appreciate your business!"
+}
+DEFAULT_TEMPLATE = "Hi {name}! Thank you for your interest."
+
+# Used for these variables when the caller did not supply them; any other
+# missing variable is an error
+TEMPLATE_DEFAULTS = {"name": "there", "company": "our company", "service": "our services"}
+
+def _compile_template(template: str) -> List[Tuple[str, Optional[str]]]:
+    """Split a template into (literal, field name) pairs once, up front"""
+    return [(literal, name) for literal, name, _, _ in string.Formatter().parse(template)]
+
+_COMPILED_TEMPLATES = {name: _compile_template(template) for name, template in MESSAGE_TEMPLATES.items()}
+_COMPILED_DEFAULT_TEMPLATE = _compile_template(DEFAULT_TEMPLATE)
+
+class _Payload:
+    """Dict conversion shared by the slotted result types"""
+    
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+    
+    def to_json(self) -> bytes:
+        """Serialize with orjson; naive datetimes are rendered as UTC"""
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_NAIVE_UTC)
+
+@dataclass(slots=True, frozen=True)
+class SendResult(_Payload):
+    """Result of a sent WhatsApp message"""
+    message_sid: str
+    status: str
+    to_number: str
+    sent_at: datetime  # naive UTC, taken when Twilio accepted the message
+    metadata: Dict = field(default_factory=dict)
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class TemplateSendResult(SendResult):
+    """Result of a sent template message"""
+    template_name: str
+    template_variables: Dict
+
+@dataclass(slots=True, frozen=True)
+class MessageStatus(_Payload):
+    """Delivery status of a sent message"""
+    message_sid: str
+    status: str
+    error_code: Optional[int]
+    error_message: Optional[str]
+    sent_at: Optional[datetime]
+    delivered_at: Optional[datetime]
+
+@dataclass(slots=True, frozen=True)
+class ParsedWebhook(_Payload):
+    """Incoming Twilio webhook payload"""
+    message_sid: Optional[str]
+    from_number: str
+    to_number: str
+    body: str
+    message_status: Optional[str]
+    timestamp: Optional[str]
+    account_sid: Optional[str]
+    num_media: str
+    media_urls: Sequence[str]
+    raw_data: Dict
+
+@dataclass(slots=True, frozen=True)
+class AccountInfo(_Payload):
+    """Twilio account details"""
+    account_sid: str
+    friendly_name: str
+    status: str
+    type: str
+    date_created: Optional[datetime]
+    date_updated: Optional[datetime]
+
+class BulkSendResult(NamedTuple):
+    """Outcome of one bulk entry: the SendResult, or the error text on failure"""
+    success: bool
+    payload: Union[SendResult, str]
+    original_data: Dict
+    
+    def to_dict(self) -> Dict[str, Any]:
+        if self.success:
+            return {"success": True, "data": self.payload.to_dict(), "original_data": self.original_data}
+        return {"success": False, "error": self.payload, "original_data": self.original_data}
+
+class TokenBucket:
+    """Asyncio token bucket allowing `rate` acquisitions per second
+    
+    The token count is shared by every event loop using the bucket, so the
+    rate holds across threads. Waiters queue on an asyncio.Lock per loop,
+    since an asyncio.Lock is bound to the loop it was first contended on.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        # At least one whole token must fit, or fractional rates never send
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._state_lock = threading.Lock()
+        self._loop_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+    
+    def _loop_lock(self) -> asyncio.Lock:
+        """Return the lock for the running event loop"""
+        
+        loop = asyncio.get_running_loop()
+        lock = self._loop_locks.get(loop)
+        if lock is None:
+            lock = self._loop_locks[loop] = asyncio.Lock()
+        return lock
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        
+        async with self._loop_lock():
+            while True:
+                with self._state_lock:
+                    now = time.monotonic()
+                    self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                    self._last = now
+                    
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    
+                    wait = (1 - self._tokens) / self.rate
+                
+                await asyncio.sleep(wait)
+
+class BatchingSendQueue:
+    """Coalesces concurrent single-message sends into one dispatch pass
+    
+    Submissions made while a flush is pending join that flush, so a burst
+    from many webhook handlers goes out back-to-back over the shared HTTP/2
+    connection. There is no timer: a lone submission flushes on the next
+    loop iteration.
+    """
+    
+    def __init__(self, send: Callable[..., Awaitable[Any]]):
+        self._send = send
+        self._pending: List[Tuple[Dict[str, Any], "asyncio.Future[Any]"]] = []
+        self._flush_scheduled = False
+        self._tasks: Set["asyncio.Task[None]"] = set()
+    
+    async def submit(self, **kwargs: Any) -> Any:
+        """Queue one send and wait for its result"""
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((kwargs, future))
+        
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        
+        return await future
+    
+    def _flush(self) -> None:
+        """Take everything queued so far and dispatch it as one batch"""
+        
+        self._flush_scheduled = False
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        
+        task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _dispatch(self, batch: List[Tuple[Dict[str, Any], "asyncio.Future[Any]"]]) -> None:
+        outcomes = await asyncio.gather(
+            *[self._send(**kwargs) for kwargs, _ in batch],
+            return_exceptions=True
+        )
+        
+        for (_, future), outcome in zip(batch, outcomes):
+            if future.done():  # caller went away
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+class _LoopClient(NamedTuple):
+    """Async HTTP client and send queue owned by one event loop"""
+    http_client: httpx.AsyncClient
+    send_queue: BatchingSendQueue
+
+# Shared media_urls value for webhooks without media
+_EMPTY_MEDIA: Tuple[str, ...] = ()
+
+# Deletes every non-digit Latin-1 character in a single C-level pass
+_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(256) if not chr(c).isdigit()))
+
+def _wa(number: str) -> str:
+    """Address a phone number on the WhatsApp channel"""
+    return "whatsapp:" + number
+
+def _toggle_default_port(url: str) -> str:
+    """Return the URL with its port removed, or the scheme's default port added"""
+    
+    parts = urlsplit(url)
+    if parts.port:
+        return parts._replace(netloc=parts.netloc.rsplit(":", 1)[0]).geturl()
+    
+    port = 443 if parts.scheme == "https" else 80
+    return parts._replace(netloc=f"{parts.netloc}:{port}").geturl()
+
+def _is_retryable(error: BaseException) -> bool:
+    """Retry only responses where Twilio did not accept the message"""
+    return (
+        isinstance(error, httpx.HTTPStatusError)
+        and error.response.status_code in RETRYABLE_POST_STATUSES
+    )
+
 class WhatsAppService:
     """WhatsApp messaging service using Twilio"""
     
     def __init__(self):
-        self.client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+        # Keep a warm pool of keep-alive TLS connections for the SDK so sync
+        # sends skip the TCP/TLS handshake. Connection errors and idempotent
+        # requests are retried; POSTs are not, to avoid duplicate messages.
+        http_client = TwilioHttpClient(pool_connections=True)
+        http_client.session.mount("https://", HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False
+            )
+        ))
+        self.client = Client(
+            settings.TWILIO_ACCOUNT_SID,
+            settings.TWILIO_AUTH_TOKEN,
+            http_client=http_client
+        )
+        self._http_session = http_client.session
         self.from_number = settings.TWILIO_PHONE_NUMBER
+        self._from_whatsapp = _wa(self.from_number)
+        self._auth_token_bytes = settings.TWILIO_AUTH_TOKEN.encode("utf-8")
+        self._messages_url = f"{TWILIO_API_BASE_URL}/Accounts/{settings.TWILIO_ACCOUNT_SID}/Messages.json"
+        credentials = f"{settings.TWILIO_ACCOUNT_SID}:{settings.TWILIO_AUTH_TOKEN}".encode("utf-8")
+        self._auth_headers = {"Authorization": "Basic " + base64.b64encode(credentials).decode("ascii")}
+        
+        # Async HTTP clients are bound to the event loop that opened them, so
+        # each loop gets its own client and send queue on first use
+        self._loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClient]" = weakref.WeakKeyDictionary()
+        
+        # Keep async sends under Twilio's WhatsApp throughput limits
+        self._text_bucket = TokenBucket(settings.WHATSAPP_MPS, settings.WHATSAPP_MPS)
+        self._media_bucket = TokenBucket(settings.WHATSAPP_MEDIA_MPS, settings.WHATSAPP_MEDIA_MPS)
+        self._send_log_counter = 0
+        self._account_info_cache: TTLCache = TTLCache(maxsize=1, ttl=ACCOUNT_INFO_TTL_SECONDS)
+    
+    def _sample_send_log(self) -> bool:
+        """Return True for one in every LOG_SAMPLE_N successful sends"""
+        self._send_log_counter = (self._send_log_counter + 1) % settings.LOG_SAMPLE_N
+        return self._send_log_counter == 0
+    
+    def _sent_result(
+        self, 
+        message_sid: str, 
+        status: str, 
+        formatted_number: str, 
+        metadata: Optional[Dict], 
+        log_sent: bool = True
+    ) -> SendResult:
+        """Log a sampled send and build its result"""
+        
+        if log_sent and self._sample_send_log():
+            logger.info("WhatsApp message sent", 
+                       message_sid=message_sid,
+                       to_number=formatted_number,
+                       status=status,
+                       sample_rate=settings.LOG_SAMPLE_N)
+        
+        return SendResult(
+            message_sid=message_sid,
+            status=status,
+            to_number=formatted_number,
+            sent_at=datetime.utcnow(),
+            metadata=metadata or {}
+        )
+    
+    def _new_http_client(self) -> httpx.AsyncClient:
+        """HTTP/2 pool for async sends
+        
+        Concurrent requests are multiplexed over the same connection instead
+        of one TLS setup each.
+        """
+        return httpx.AsyncClient(
+            http2=True,
+            auth=(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    
+    def _loop_client(self) -> _LoopClient:
+        """Return the client and send queue for the running event loop"""
+        
+        loop = asyncio.get_running_loop()
+        loop_client = self._loop_clients.get(loop)
+        if loop_client is None:
+            loop_client = self._loop_clients[loop] = _LoopClient(
+                self._new_http_client(),
+                BatchingSendQueue(self._send_message_async)
+            )
+        return loop_client
+    
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Pooled async HTTP client for the running event loop"""
+        return self._loop_client().http_client
+    
+    async def aclose(self) -> None:
+        """Close the running event loop's pooled HTTP connections
+        
+        Long-lived loops (the web app) call this on shutdown. Bulk sends use
+        their own client and close it themselves.
+        """
+        
+        loop_client = self._loop_clients.pop(asyncio.get_running_loop(), None)
+        if loop_client is not None:
+            await loop_client.http_client.aclose()
     
     def send_message(
         self, 
         to_number: str, 
         message: str, 
         metadata: Optional[Dict] = None
-    ) -> Dict:
+    ) -> SendResult:
         """Send WhatsApp message via Twilio"""
         
         try:
@@ -30,23 +390,12 @@ class WhatsAppService:
             
             # Send message
             message_obj = self.client.messages.create(
-                from_=f"whatsapp:{self.from_number}",
+                from_=self._from_whatsapp,
                 body=message,
-                to=f"whatsapp:{formatted_number}"
+                to=_wa(formatted_number)
             )
             
-            logger.info("WhatsApp message sent", 
-                       message_sid=message_obj.sid,
-                       to_number=formatted_number,
-                       status=message_obj.status)
-            
-            return {
-                "message_sid": message_obj.sid,
-                "status": message_obj.status,
-                "to_number": formatted_number,
-                "sent_at": datetime.utcnow(),
-                "metadata": metadata or {}
-            }
+            return self._sent_result(message_obj.sid, message_obj.status, formatted_number, metadata)
             
         except TwilioException as e:
             logger.error("Failed to send WhatsApp message", 
@@ -54,13 +403,54 @@ class WhatsAppService:
                         to_number=to_number)
             raise
     
+    def send_message_fast(
+        self, 
+        to_number: str, 
+        message: str, 
+        metadata: Optional[Dict] = None
+    ) -> SendResult:
+        """Send WhatsApp message with a direct POST, bypassing the SDK resources
+        
+        The URL and auth header are built once in __init__, and the request
+        reuses the SDK's pooled session. Twilio errors and response bodies
+        that are not JSON are raised as TwilioRestException, as the SDK would.
+        """
+        
+        formatted_number = self._format_phone_number(to_number)
+        response = self._http_session.post(
+            self._messages_url,
+            data={"From": self._from_whatsapp, "To": _wa(formatted_number), "Body": message},
+            headers=self._auth_headers
+        )
+        
+        try:
+            message_obj = response.json()
+        except ValueError:
+            message_obj = None
+        
+        if response.status_code >= 400 or not isinstance(message_obj, dict):
+            error = message_obj if isinstance(message_obj, dict) else {}
+            logger.error("Failed to send WhatsApp message", 
+                        error=error.get("message", response.text),
+                        to_number=to_number)
+            raise TwilioRestException(
+                response.status_code,
+                self._messages_url,
+                msg=error.get("message", response.text),
+                code=error.get("code"),
+                method="POST",
+                details=error.get("details")
+            )
+        
+        return self._sent_result(message_obj["sid"], message_obj["status"], formatted_number, metadata)
+    
     def send_template_message(
         self, 
         to_number: str, 
         template_name: str, 
         template_variables: Dict,
         metadata: Optional[Dict] = None
-    ) -> Dict:
+    ) -> TemplateSendResult:
         """Send WhatsApp template message"""
         
         try:
@@ -68,42 +458,45 @@ class WhatsAppService:
             
             # Create message with template
             message_obj = self.client.messages.create(
-                from_=f"whatsapp:{self.from_number}",
+                from_=self._from_whatsapp,
                 body=self._build_template_message(template_name, template_variables),
-                to=f"whatsapp:{formatted_number}"
+                to=_wa(formatted_number)
             )
             
-            logger.info("WhatsApp template message sent",
-                       message_sid=message_obj.sid,
-                       template_name=template_name)
+            if self._sample_send_log():
+                logger.info("WhatsApp template message sent",
+                           message_sid=message_obj.sid,
+                           template_name=template_name,
+                           sample_rate=settings.LOG_SAMPLE_N)
             
-            return {
-                "message_sid": message_obj.sid,
-                "status": message_obj.status,
-                "template_name": template_name,
-                "template_variables": template_variables,
-                "sent_at": datetime.utcnow(),
-                "metadata": metadata or {}
-            }
+            return TemplateSendResult(
+                message_sid=message_obj.sid,
+                status=message_obj.status,
+                to_number=formatted_number,
+                sent_at=datetime.utcnow(),
+                metadata=metadata or {},
+                template_name=template_name,
+                template_variables=template_variables
+            )
             
         except TwilioException as e:
             logger.error("Failed to send template message", error=str(e))
             raise
     
-    def get_message_status(self, message_sid: str) -> Dict:
+    def get_message_status(self, message_sid: str) -> MessageStatus:
         """Get status of a sent message"""
         
         try:
             message = self.client.messages(message_sid).fetch()
             
-            return {
-                "message_sid": message.sid,
-                "status": message.status,
-                "error_code": message.error_code,
-                "error_message": message.error_message,
-                "sent_at": message.date_sent,
-                "delivered_at": message.date_delivered
-            }
+            return MessageStatus(
+                message_sid=message.sid,
+                status=message.status,
+                error_code=message.error_code,
+                error_message=message.error_message,
+                sent_at=message.date_sent,
+                delivered_at=message.date_delivered
+            )
             
         except TwilioException as e:
             logger.error("Failed to get message status", 
@@ -120,66 +513,226 @@ class WhatsAppService:
         """Validate Twilio webhook signature"""
         
         try:
-            from twilio.request_validator import RequestValidator
-            validator = RequestValidator(settings.TWILIO_AUTH_TOKEN)
+            params = params or {}
+            expected = signature.encode("utf-8")
             
-            return validator.validate(url, params, signature)
+            if hmac.compare_digest(self._compute_signature(url, params), expected):
+                return True
+            
+            # Twilio signs the URL either with or without the default port
+            return hmac.compare_digest(
+                self._compute_signature(_toggle_default_port(url), params), expected
+            )
             
         except Exception as e:
             logger.error("Failed to validate webhook signature", error=str(e))
             return False
     
-    def parse_webhook_data(self, webhook_data: Dict) -> Dict:
+    def _compute_signature(self, url: str, params: Dict) -> bytes:
+        """Compute Twilio's HMAC-SHA1 request signature (base64-encoded)"""
+        
+        getlist = getattr(params, "getlist", None)
+        if getlist is None:
+            canonical = url + "".join(key + params[key] for key in sorted(params))
+        else:
+            # Multi-value form data, e.g. repeated MediaUrl fields
+            canonical = url + "".join(
+                key + value
+                for key in sorted(set(params))
+                for value in sorted(set(getlist(key)))
+            )
+        
+        digest = hmac.new(self._auth_token_bytes, canonical.encode("utf-8"), hashlib.sha1).digest()
+        return base64.b64encode(digest)
+    
+    def parse_webhook_data(self, webhook_data: Dict) -> ParsedWebhook:
         """Parse incoming webhook data from Twilio"""
         
         try:
-            return {
-                "message_sid": webhook_data.get("MessageSid"),
-                "from_number": webhook_data.get("From", "").replace("whatsapp:", ""),
-                "to_number": webhook_data.get("To", "").replace("whatsapp:", ""),
-                "body": webhook_data.get("Body", ""),
-                "message_status": webhook_data.get("MessageStatus"),
-                "timestamp": webhook_data.get("MessageTimestamp"),
-                "account_sid": webhook_data.get("AccountSid"),
-                "num_media": webhook_data.get("NumMedia", "0"),
-                "media_urls": webhook_data.get("MediaUrl0", "").split(",") if webhook_data.get("MediaUrl0") else [],
-                "raw_data": webhook_data
-            }
+            # Twilio sends each attachment as its own MediaUrl<i> field
+            num_media = webhook_data.get("NumMedia", "0")
+            try:
+                media_count = int(num_media or 0)
+            except (TypeError, ValueError):
+                media_count = 0
+            
+            media_urls = _EMPTY_MEDIA
+            if media_count > 0:
+                urls = [webhook_data.get(f"MediaUrl{i}") for i in range(media_count)]
+                media_urls = [url for url in urls if url]
+            
+            return ParsedWebhook(
+                message_sid=webhook_data.get("MessageSid"),
+                from_number=webhook_data.get("From", "").replace("whatsapp:", ""),
+                to_number=webhook_data.get("To", "").replace("whatsapp:", ""),
+                body=webhook_data.get("Body", ""),
+                message_status=webhook_data.get("MessageStatus"),
+                timestamp=webhook_data.get("MessageTimestamp"),
+                account_sid=webhook_data.get("AccountSid"),
+                num_media=num_media,
+                media_urls=media_urls,
+                raw_data=webhook_data
+            )
             
         except Exception as e:
             logger.error("Failed to parse webhook data", error=str(e))
             raise
     
-    def send_bulk_messages(
+    @retry(
+        retry=retry_if_exception(_is_retryable),
+        wait=wait_exponential(multiplier=0.5, max=8),
+        stop=stop_after_attempt(5),
+        reraise=True
+    )
+    async def _post_message(self, data: Dict, client: Optional[httpx.AsyncClient] = None) -> Dict:
+        """POST a message to Twilio, rate limited and retried on 429/503"""
+        
+        bucket = self._media_bucket if "MediaUrl" in data else self._text_bucket
+        await bucket.acquire()
+        
+        response = await (client or self.http_client).post(self._messages_url, data=data)
+        response.raise_for_status()
+        return response.json()
+    
+    async def _send_message_async(
+        self, 
+        to_number: str, 
+        message: str, 
+        metadata: Optional[Dict] = None,
+        media_urls: Optional[List[str]] = None
+    ) -> SendResult:
+        """Send WhatsApp message via Twilio's REST API without blocking the loop"""
+        
+        formatted_number = self._format_phone_number(to_number)
+        return await self._deliver_message(formatted_number, message, metadata, media_urls)
+    
+    async def _deliver_message(
+        self, 
+        formatted_number: str, 
+        message: str, 
+        metadata: Optional[Dict] = None,
+        media_urls: Optional[List[str]] = None,
+        log_sent: bool = True,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> SendResult:
+        """Post an already formatted message to Twilio"""
+        
+        data = {
+            "From": self._from_whatsapp,
+            "To": _wa(formatted_number),
+            "Body": message
+        }
+        if media_urls:
+            data["MediaUrl"] = list(media_urls)
+        
+        message_obj = await self._post_message(data, client)
+        return self._sent_result(
+            message_obj["sid"], message_obj["status"], formatted_number, metadata, log_sent
+        )
+    
+    async def submit_message(
+        self, 
+        to_number: str, 
+        message: str, 
+        metadata: Optional[Dict] = None,
+        media_urls: Optional[List[str]] = None
+    ) -> SendResult:
+        """Send WhatsApp message from async code, coalesced with concurrent sends"""
+        
+        return await self._loop_client().send_queue.submit(
+            to_number=to_number,
+            message=message,
+            metadata=metadata,
+            media_urls=media_urls
+        )
+    
+    def _prepare_bulk_item(self, message_data: Dict) -> Dict:
+        """Format and render one bulk entry into _deliver_message arguments"""
+        
+        if "template_name" in message_data:
+            message = self._build_template_message(
+                message_data["template_name"],
+                message_data.get("template_variables") or {}
+            )
+        else:
+            message = message_data["message"]
+        
+        return {
+            "formatted_number": self._format_phone_number(message_data["to_number"]),
+            "message": message,
+            "metadata": message_data.get("metadata"),
+            "media_urls": message_data.get("media_urls"),
+            "log_sent": False  # summarised once per batch instead
+        }
+    
+    def _bulk_failure(self, message_data: Dict, error: Exception) -> BulkSendResult:
+        """Log a failed bulk entry and build its result"""
+        logger.error("Failed to send bulk message", 
+                   to_number=message_data.get("to_number"),
+                   error=str(error))
+        return BulkSendResult(False, str(error), message_data)
+    
+    async def send_bulk_messages(
         self, 
         messages: List[Dict]
-    ) -> List[Dict]:
-        """Send multiple messages in batch"""
+    ) -> List[BulkSendResult]:
+        """Send multiple messages in batch
         
-        results = []
+        Entries carry either "message" or "template_name" (plus optional
+        "template_variables"). A producer formats and renders entries into
+        a bounded queue while BULK_SEND_WORKERS consumers post them, so
+        preparation overlaps with waiting on Twilio. The batch gets its own
+        HTTP client, closed when it finishes, so sync callers can run each
+        batch under its own asyncio.run(). Results are returned in input
+        order; use BulkSendResult.to_dict() for the dict form.
+        """
         
-        for message_data in messages:
-            try:
-                result = self.send_message(
-                    to_number=message_data["to_number"],
-                    message=message_data["message"],
-                    metadata=message_data.get("metadata")
-                )
-                results.append({
-                    "success": True,
-                    "data": result,
-                    "original_data": message_data
-                })
+        started = time.monotonic()
+        results: List[Optional[BulkSendResult]] = [None] * len(messages)
+        ready: "asyncio.Queue[Optional[Tuple[int, Dict, Dict]]]" = asyncio.Queue(maxsize=BULK_QUEUE_SIZE)
+        
+        async def prepare() -> None:
+            for index, message_data in enumerate(messages):
+                try:
+                    payload = self._prepare_bulk_item(message_data)
+                except Exception as e:
+                    results[index] = self._bulk_failure(message_data, e)
+                    continue
+                await ready.put((index, message_data, payload))
+                # put() only suspends on a full queue; yield so senders start
+                # posting while the rest of the batch is still being prepared
+                await asyncio.sleep(0)
+        
+        async def send(client: httpx.AsyncClient) -> None:
+            while True:
+                item = await ready.get()
+                if item is None:
+                    return
                 
-            except Exception as e:
-                logger.error("Failed to send bulk message", 
-                           to_number=message_data.get("to_number"),
-                           error=str(e))
-                results.append({
-                    "success": False,
-                    "error": str(e),
-                    "original_data": message_data
-                })
+                index, message_data, payload = item
+                try:
+                    results[index] = BulkSendResult(
+                        True, await self._deliver_message(**payload, client=client), message_data
+                    )
+                except Exception as e:
+                    results[index] = self._bulk_failure(message_data, e)
+        
+        async with self._new_http_client() as client:
+            workers = [asyncio.create_task(send(client)) for _ in range(min(BULK_SEND_WORKERS, len(messages)))]
+            try:
+                await prepare()
+                for _ in workers:
+                    await ready.put(None)
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+        
+        sent = sum(1 for result in results if result is not None and result.success)
+        logger.info("WhatsApp bulk send finished",
+                   sent=sent,
+                   failed=len(messages) - sent,
+                   duration_ms=round((time.monotonic() - started) * 1000))
         
         return results
     
@@ -187,7 +740,10 @@ class WhatsAppService:
         """Format phone number for WhatsApp"""
         
         # Remove any non-digit characters
-        cleaned = ''.join(filter(str.isdigit, phone_number))
+        cleaned = phone_number.translate(_NON_DIGITS)
+        if not cleaned.isascii():
+            # Characters beyond Latin-1 are not covered by the table
+            cleaned = ''.join(filter(str.isdigit, cleaned))
         
         # Ensure it starts with country code
         if not cleaned.startswith('1') and len(cleaned) == 10:
@@ -198,71 +754,85 @@ class WhatsAppService:
     def _build_template_message(self, template_name: str, variables: Dict) -> str:
         """Build template message with variables"""
         
-        # Simple template system - in production, you'd use Twilio's template system
-        templates = {
-            "welcome": "Hi {name}! Welcome to {company}. Thanks for your interest in {service}.",
-            "follow_up": "Hi {name}! Just following up on our conversation about {service}. Are you still interested?",
-            "appointment": "Hi {name}! Your appointment with {company} is confirmed for {date} at {time}.",
-            "reminder": "Hi {name}! Don't forget about your upcoming {service} consultation.",
-            "thank_you": "Hi {name}! Thank you for choosing {company}. We appreciate your business!"
-        }
+        compiled = _COMPILED_TEMPLATES.get(template_name, _COMPILED_DEFAULT_TEMPLATE)
         
-        template = templates.get(template_name, "Hi {name}! Thank you for your interest.")
+        parts = []
+        for literal, name in compiled:
+            parts.append(literal)
+            if name is None:
+                continue
+            
+            value = variables.get(name)
+            if value is None:
+                logger.error("Missing template variable", variable=name)
+                if name not in TEMPLATE_DEFAULTS:
+                    # Never send a message with a blank where e.g. a date belongs
+                    raise KeyError(name)
+                value = TEMPLATE_DEFAULTS[name]
+            parts.append(str(value))
         
-        try:
-            return template.format(**variables)
-        except KeyError as e:
-            logger.error("Missing template variable", variable=str(e))
-            return template.format(name="there", company="our company", service="our services")
+        return "".join(parts)
     
-    def get_account_info(self) -> Dict:
-        """Get Twilio account information"""
+    def get_account_info(self) -> AccountInfo:
+        """Get Twilio account information, cached for ACCOUNT_INFO_TTL_SECONDS"""
+        
+        info = self._account_info_cache.get("info")
+        if info is not None:
+            return info
         
         try:
             account = self.client.api.accounts(settings.TWILIO_ACCOUNT_SID).fetch()
             
-            return {
-                "account_sid": account.sid,
-                "friendly_name": account.friendly_name,
-                "status": account.status,
-                "type": account.type,
-                "date_created": account.date_created,
-                "date_updated": account.date_updated
-            }
+            info = AccountInfo(
+                account_sid=account.sid,
+                friendly_name=account.friendly_name,
+                status=account.status,
+                type=account.type,
+                date_created=account.date_created,
+                date_updated=account.date_updated
+            )
             
         except TwilioException as e:
             logger.error("Failed to get account info", error=str(e))
             raise
+        
+        self._account_info_cache["info"] = info
+        return info
     
     def get_usage_stats(self, start_date: str, end_date: str) -> Dict:
         """Get usage statistics for the account"""
         
         try:
-            usage_records = self.client.usage.records.list(
+            # stream() pages lazily, so aggregation starts on the first page
+            usage_records = self.client.usage.records.stream(
                 start_date=start_date,
-                end_date=end_date
+                end_date=end_date,
+                page_size=USAGE_PAGE_SIZE
             )
             
-            stats = {
-                "total_messages": 0,
-                "total_cost": 0,
-                "by_category": {}
-            }
+            # [count, cost] lists are cheaper to update in the loop than dicts
+            by_category = defaultdict(lambda: [0, 0])
+            total_messages = 0
+            total_cost = 0
             
             for record in usage_records:
-                category = record.category
-                if category not in stats["by_category"]:
-                    stats["by_category"][category] = {
-                        "count": 0,
-                        "cost": 0
-                    }
+                count = int(record.count)
+                price = float(record.price)
                 
-                stats["by_category"][category]["count"] += int(record.count)
-                stats["by_category"][category]["cost"] += float(record.price)
-                stats["total_messages"] += int(record.count)
-                stats["total_cost"] += float(record.price)
+                bucket = by_category[record.category]
+                bucket[0] += count
+                bucket[1] += price
+                total_messages += count
+                total_cost += price
             
-            return stats
+            return {
+                "total_messages": total_messages,
+                "total_cost": total_cost,
+                "by_category": {
+                    category: {"count": count, "cost": cost}
+                    for category, (count, cost) in by_category.items()
+                }
+            }
             
         except TwilioException as e:
             logger.error("Failed to get usage stats", error=str(e))
@@ -0,0 +1,7 @@
+#!/bin/sh
+set -e
+
+# Bring the schema up to date before the app starts; workers never run DDL
+alembic upgrade head
+
+exec "$@"
@@ -0,0 +1,9 @@
+import os
+
+# Settings are loaded at import time and require these outside DEBUG
+os.environ.setdefault("DEBUG", "true")
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("TWILIO_ACCOUNT_SID", "ACtest")
+os.environ.setdefault("TWILIO_AUTH_TOKEN", "test-auth-token")
+os.environ.setdefault("TWILIO_PHONE_NUMBER", "+15550000000")
+os.environ.setdefault("PRIVYR_API_KEY", "test-privyr-key")
@@ -0,0 +1,43 @@
+import pytest
+import requests
+from twilio.base.exceptions import TwilioRestException
+
+from app.services.whatsapp_service import SendResult, WhatsAppService
+
+def make_response(status_code, content):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+@pytest.fixture
+def service():
+    return WhatsAppService()
+
+def test_returns_send_result(service, monkeypatch):
+    response = make_response(201, b'{"sid": "SM123", "status": "queued"}')
+    monkeypatch.setattr(service._http_session, "post", lambda *args, **kwargs: response)
+
+    result = service.send_message_fast("(555) 123-4567", "Hi")
+
+    assert isinstance(result, SendResult)
+    assert result.message_sid == "SM123"
+    assert result.to_number == "15551234567"
+
+def test_twilio_error_raises_rest_exception(service, monkeypatch):
+    response = make_response(400, b'{"code": 21211, "message": "Invalid To number"}')
+    monkeypatch.setattr(service._http_session, "post", lambda *args, **kwargs: response)
+
+    with pytest.raises(TwilioRestException) as excinfo:
+        service.send_message_fast("123", "Hi")
+
+    assert excinfo.value.code == 21211
+
+def test_non_json_success_body_raises_rest_exception(service, monkeypatch):
+    response = make_response(200, b"<html>gateway</html>")
+    monkeypatch.setattr(service._http_session, "post", lambda *args, **kwargs: response)
+
+    with pytest.raises(TwilioRestException) as excinfo:
+        service.send_message_fast("5551234567", "Hi")
+
+    assert excinfo.value.status == 200
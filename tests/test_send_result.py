@@ -0,0 +1,48 @@
+from datetime import datetime
+
+import orjson
+
+from app.services.whatsapp_service import SendResult, TemplateSendResult
+
+SENT_AT = datetime(2024, 1, 2, 3, 4, 5, 123456)
+
+SEND_KEYS = {"message_sid", "status", "to_number", "sent_at", "metadata"}
+TEMPLATE_KEYS = SEND_KEYS | {"template_name", "template_variables"}
+
+def make_result():
+    return SendResult(
+        message_sid="SM123",
+        status="queued",
+        to_number="15551234567",
+        sent_at=SENT_AT,
+    )
+
+def make_template_result():
+    return TemplateSendResult(
+        message_sid="SM123",
+        status="queued",
+        to_number="15551234567",
+        sent_at=SENT_AT,
+        template_name="welcome",
+        template_variables={"name": "Ana"},
+    )
+
+def test_send_result_keys_match_across_serializers():
+    result = make_result()
+
+    assert set(result.to_dict()) == SEND_KEYS
+    assert set(orjson.loads(orjson.dumps(result))) == SEND_KEYS
+    assert set(orjson.loads(result.to_json())) == SEND_KEYS
+
+def test_template_send_result_keys_match_across_serializers():
+    result = make_template_result()
+
+    assert set(result.to_dict()) == TEMPLATE_KEYS
+    assert set(orjson.loads(orjson.dumps(result))) == TEMPLATE_KEYS
+    assert set(orjson.loads(result.to_json())) == TEMPLATE_KEYS
+
+def test_sent_at_serializes_as_datetime():
+    result = make_result()
+
+    assert result.to_dict()["sent_at"] == SENT_AT
+    assert orjson.loads(orjson.dumps(result))["sent_at"] == "2024-01-02T03:04:05.123456"
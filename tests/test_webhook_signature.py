@@ -0,0 +1,86 @@
+import pytest
+from twilio.request_validator import RequestValidator
+
+from app.core.config import settings
+from app.services.whatsapp_service import WhatsAppService
+
+PARAMS = {
+    "MessageSid": "SM123",
+    "From": "whatsapp:+15551234567",
+    "To": "whatsapp:+15550000000",
+    "Body": "Hi, is this still available?",
+    "NumMedia": "0",
+}
+
+class MultiValueForm(dict):
+    """Minimal stand-in for a multi-value form (e.g. Starlette's FormData)"""
+
+    def __init__(self, items):
+        super().__init__()
+        self._items = list(items)
+        for key, value in self._items:
+            self[key] = value
+
+    def getlist(self, key):
+        return [value for item_key, value in self._items if item_key == key]
+
+@pytest.fixture(scope="module")
+def service():
+    return WhatsAppService()
+
+@pytest.fixture(scope="module")
+def validator():
+    return RequestValidator(settings.TWILIO_AUTH_TOKEN)
+
+def assert_matches_validator(service, validator, signature, url, params):
+    expected = validator.validate(url, params, signature)
+    assert service.validate_webhook_signature(signature, url, params) is expected
+    return expected
+
+@pytest.mark.parametrize("url", [
+    "https://example.com/webhooks/whatsapp",
+    "https://example.com/webhooks/whatsapp?campaign=7&source=ads",
+    "http://example.com/webhooks/whatsapp",
+])
+def test_plain_url(service, validator, url):
+    signature = validator.compute_signature(url, PARAMS)
+    assert assert_matches_validator(service, validator, signature, url, PARAMS)
+
+@pytest.mark.parametrize("signed_url, received_url", [
+    # Twilio signed with the default port, the app sees the URL without it
+    ("https://example.com:443/webhooks/whatsapp", "https://example.com/webhooks/whatsapp"),
+    ("http://example.com:80/webhooks/whatsapp", "http://example.com/webhooks/whatsapp"),
+    # ... and the other way round
+    ("https://example.com/webhooks/whatsapp", "https://example.com:443/webhooks/whatsapp"),
+    ("http://example.com/webhooks/whatsapp", "http://example.com:80/webhooks/whatsapp"),
+])
+def test_default_port_added_or_stripped(service, validator, signed_url, received_url):
+    signature = validator.compute_signature(signed_url, PARAMS)
+    assert assert_matches_validator(service, validator, signature, received_url, PARAMS)
+
+def test_multi_value_form_data(service, validator):
+    url = "https://example.com/webhooks/whatsapp"
+    params = MultiValueForm([
+        ("MessageSid", "SM123"),
+        ("NumMedia", "2"),
+        ("MediaUrl", "https://api.twilio.com/media/b"),
+        ("MediaUrl", "https://api.twilio.com/media/a"),
+    ])
+    signature = validator.compute_signature(url, params)
+    assert assert_matches_validator(service, validator, signature, url, params)
+
+@pytest.mark.parametrize("tamper", [
+    lambda url, params, signature: (url, {**params, "Body": "tampered"}, signature),
+    lambda url, params, signature: (url + "/other", params, signature),
+    lambda url, params, signature: (url, params, "bm90IGEgc2lnbmF0dXJl"),
+    lambda url, params, signature: (url, params, ""),
+])
+def test_bad_signature(service, validator, tamper):
+    url = "https://example.com/webhooks/whatsapp"
+    url, params, signature = tamper(url, PARAMS, validator.compute_signature(url, PARAMS))
+    assert not assert_matches_validator(service, validator, signature, url, params)
+
+def test_signature_from_other_token(service):
+    url = "https://example.com/webhooks/whatsapp"
+    signature = RequestValidator("another-token").compute_signature(url, PARAMS)
+    assert not service.validate_webhook_signature(signature, url, PARAMS)